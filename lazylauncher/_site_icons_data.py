@@ -0,0 +1,61 @@
+"""
+Site icon mappings for LazyLauncher.
+
+Generated by scripts/gen_site_icons.py from assets/site_icons.json - do not edit by hand.
+"""
+
+SITE_ICONS = {
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+    'twitch.tv': 'twitch',
+    'netflix.com': 'netflix',
+    'disneyplus.com': 'disneyplus',
+    'primevideo.com': 'primevideo',
+    'hulu.com': 'hulu',
+    'spotify.com': 'spotify',
+    'soundcloud.com': 'soundcloud',
+    'instagram.com': 'instagram',
+    'facebook.com': 'facebook',
+    'messenger.com': 'facebook-messenger',
+    'linkedin.com': 'linkedin',
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'pinterest.com': 'pinterest',
+    'reddit.com': 'reddit',
+    'tiktok.com': 'tiktok',
+    'snapchat.com': 'snapchat',
+    'google.com': 'google',
+    'bing.com': 'bing',
+    'duckduckgo.com': 'duckduckgo',
+    'wikipedia.org': 'wikipedia',
+    'quora.com': 'quora',
+    'drive.google.com': 'google-drive',
+    'docs.google.com': 'google-docs',
+    'sheets.google.com': 'google-sheets',
+    'slides.google.com': 'google-slides',
+    'meet.google.com': 'google-meet',
+    'mail.google.com': 'gmail',
+    'github.com': 'github',
+    'gitlab.com': 'gitlab',
+    'bitbucket.org': 'bitbucket',
+    'stackoverflow.com': 'stackoverflow',
+    'notion.so': 'notion',
+    'trello.com': 'trello',
+    'slack.com': 'slack',
+    'discord.com': 'discord',
+    'teams.microsoft.com': 'teams',
+    'skype.com': 'skype',
+    'zoom.us': 'zoom',
+    'amazon.com': 'amazon',
+    'flipkart.com': 'flipkart',
+    'ebay.com': 'ebay',
+    'walmart.com': 'walmart',
+    'aliexpress.com': 'aliexpress',
+    'etsy.com': 'etsy',
+    'myntra.com': 'myntra',
+    'dropbox.com': 'dropbox',
+    'canva.com': 'canva',
+    'figma.com': 'figma',
+    'paypal.com': 'paypal',
+    'upi': 'upi',
+}
@@ -5,14 +5,43 @@ This module contains default settings and configurations for the LazyLauncher ap
 """
 
 import os
+import re
 import json
+import shutil
 import urllib.parse
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Pattern, Tuple
+
+# Desktop file template (%-style keys), shared by every Config
+_DESKTOP_TEMPLATE = """[Desktop Entry]
+Name=%(name)s
+GenericName=%(description)s
+Exec=%(exec_command)s
+Icon=%(icon)s
+Type=Application
+Comment=Open - %(description)s
+Categories=%(categories)s
+StartupNotify=true
+"""
+
+# Paths resolved once at import
+_USER_APPS_DIR = Path.home() / ".local" / "share" / "applications"
+_SYSTEM_APPS_DIR = Path("/usr/share/applications")
+_ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 
 class Config:
     """Configuration class for LazyLauncher settings."""
 
+    _instance: Optional["Config"] = None
+
+    @classmethod
+    def instance(cls) -> "Config":
+        """Return the shared Config, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
         self.app_name = "LazyLauncher"
         self.app_version = "1.0.0"
@@ -23,27 +52,43 @@ class Config:
         self.default_category = "Network;WebBrowser;"
 
         # Paths
-        self.user_applications_dir = Path.home() / ".local" / "share" / "applications"
-        self.system_applications_dir = Path("/usr/share/applications")
+        self.user_applications_dir = _USER_APPS_DIR
+        self.system_applications_dir = _SYSTEM_APPS_DIR
 
         # GUI Settings
         self.window_size = "500x400"
         self.window_title = f"{self.app_name} - Custom KRunner Shortcuts"
 
         # Desktop file template
-        self.desktop_template = """[Desktop Entry]
-Name={name}
-GenericName={description}
-Exec={exec_command}
-Icon={icon}
-Type=Application
-Comment=Open - {description}
-Categories={categories}
-StartupNotify=true
-""" 
+        self.desktop_template = _DESKTOP_TEMPLATE
+
+        # Site icons and their domain matcher are loaded lazily on first use
 
-        # Load site icons from JSON file
-        self.site_icons = self._load_site_icons()
+        # Category keyword rules, checked in priority order
+        self._category_rules = [
+            # Media Sites
+            (re.compile(r"youtube|netflix|spotify|twitch|hotstar|prime"), "AudioVideo;Audio;Video;Player;"),
+            # Development Sites
+            (re.compile(r"github|stackoverflow|gitlab|chatgpt|deepseek|gemini"), "Development;IDE;"),
+            # Social Media
+            (re.compile(r"twitch|twitter|x|facebook|linkedin|reddit|instagram"), "Network;Chat;InstantMessaging;"),
+            # Shopping
+            (re.compile(r"amazon|flipkart|ebay|shopping"), "Network;WebBrowser;"),
+            # Communication
+            (re.compile(r"discord|slack|teams|zoom"), "Network;Chat;VideoConference;"),
+        ]
+
+        # Fallback icons by URL scheme
+        self._scheme_icons = {
+            'http': 'applications-internet',
+            'https': 'applications-internet',
+            'file': 'folder',
+            'ftp': 'folder-remote',
+            'mailto': 'mail-send',
+        }
+
+        # Per-URL (icon, categories) cache
+        self._classify_cache: Dict[str, Tuple[str, str]] = {}
             
         # KDE System Command Preference
         self.kbuildsycoca_commands = [
@@ -53,20 +98,41 @@ StartupNotify=true
         ]
         
 
+    @cached_property
+    def site_icons(self) -> Dict[str, str]:
+        """Site icon mappings, loaded on first access."""
+        return self._load_site_icons()
+    
+
+    @cached_property
+    def kbuildsycoca_command(self) -> Optional[str]:
+        """First available kbuildsycoca binary on PATH, resolved once."""
+        return next((command for command in self.kbuildsycoca_commands if shutil.which(command)), None)
+    
+
     def _load_site_icons(self) -> Dict[str, str]:
-        """Load site icons from JSON file with fallback to defaults."""
+        """Load site icons from the generated data module, then JSON, then defaults."""
+        # Precomputed table (see scripts/gen_site_icons.py) avoids parsing JSON at runtime
+        try:
+            from ._site_icons_data import SITE_ICONS
+            return SITE_ICONS
+        except ImportError:
+            pass
+
         try:
             # Get the path to the site_icons.json file
-            assets_dir = Path(__file__).parent.parent / "assets"
-            icons_file = assets_dir / "site_icons.json"
+            icons_file = _ASSETS_DIR / "site_icons.json"
             
-            if icons_file.exists() and icons_file.stat().st_size > 0:
-                with open(icons_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Ensure it's a dictionary
-                    if isinstance(data, dict):
-                        return data
-        except (json.JSONDecodeError, FileNotFoundError, PermissionError) as e:
+            # Single read; a missing or empty file falls through to the defaults
+            text = icons_file.read_text(encoding='utf-8')
+            if text.strip():
+                data = json.loads(text)
+                # Ensure it's a dictionary
+                if isinstance(data, dict):
+                    return data
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, PermissionError) as e:
             print(f"Warning: Could not load site icons from JSON file: {e}")
         except Exception as e:
             print(f"Warning: Unexpected error loading site icons: {e}")
@@ -96,6 +162,18 @@ StartupNotify=true
         }
     
 
+    @cached_property
+    def _icon_pattern(self) -> Optional[Pattern[str]]:
+        """Compile all site icon domains into a single regex alternation."""
+        if not self.site_icons:
+            return None
+        # Longest domains first so the most specific match wins, and only match
+        # whole labels so e.g. 'x.com' does not hit inside 'dropbox.com'
+        domains = sorted(self.site_icons, key=len, reverse=True)
+        alternation = "|".join(re.escape(domain) for domain in domains)
+        return re.compile(rf"(?<![a-z0-9-])(?:{alternation})(?![a-z0-9-])")
+    
+
     def get_applications_dir(self, mode: str = "user") -> Path:
         """Get the application directory based on installation mode."""
         if mode == "system":
@@ -106,70 +184,71 @@ StartupNotify=true
 
     def get_icon_for_url(self, url: str) -> str:
         """Get an appropriate icon for a given URL."""
+        return self.classify(url)[0]
+        
+
+    def classify(self, url: str) -> Tuple[str, str]:
+        """Get the (icon, categories) pair for a URL, lowering it only once."""
+        result = self._classify_cache.get(url)
+        if result is None:
+            url_lower = url.lower()
+            result = self._classify_cache[url] = (
+                self._resolve_icon_for_url(url, url_lower),
+                self._resolve_categories_for_url(url, url_lower),
+            )
+        return result
+        
+
+    def _resolve_icon_for_url(self, url: str, url_lower: str) -> str:
+        """Resolve the icon for a URL without consulting the cache."""
         if not url:
             return self.default_icon
-            
-        url_lower = url.lower()
 
-        # Extract domain for better matching
-        try:
-            parsed = urllib.parse.urlparse(url)
-            if parsed.netloc:
-                domain = parsed.netloc.lower()
-                # Remove www. prefix if present
-                if domain.startswith('www.'):
-                    domain = domain[4:]
-                
-                # Check for exact domain match first
-                if domain in self.site_icons:
-                    return self.site_icons[domain]
-        except Exception:
-            pass
+        # Extract domain for better matching (bare paths have no scheme to parse)
+        scheme = ''
+        if ':' in url:
+            try:
+                parsed = urllib.parse.urlsplit(url)
+                scheme = parsed.scheme
+                if parsed.netloc:
+                    domain = parsed.netloc.lower()
+                    # Remove www. prefix if present
+                    if domain.startswith('www.'):
+                        domain = domain[4:]
+                    
+                    # Check for exact domain match first
+                    if domain in self.site_icons:
+                        return self.site_icons[domain]
+            except Exception:
+                pass
 
         # Fallback to substring matching for known Sites
-        for domain, icon in self.site_icons.items():
-            if domain in url_lower:
-                return icon
+        if self._icon_pattern is not None:
+            match = self._icon_pattern.search(url_lower)
+            if match:
+                return self.site_icons[match.group(0)]
             
         # Default Based on protocol/type
-        if url_lower.startswith(('http://', 'https://')):
-            return 'applications-internet'
-        elif url_lower.startswith('file://') or os.path.isabs(url):
-            return 'folder'
-        elif url_lower.startswith('ftp://'):
-            return 'folder-remote'
-        elif url_lower.startswith('mailto:'):
-            return 'mail-send'
-        else:
-            return self.default_icon
+        icon = self._scheme_icons.get(scheme)
+        if icon is not None:
+            return icon
+        return 'folder' if os.path.isabs(url) else self.default_icon
         
 
     def get_categories_for_url(self, url: str) -> str:
         """Get appropriate Desktop File Categories for a URL"""
-        url_lower = url.lower()
-
-        # Media Sites
-        if any(site in url_lower for site in ['youtube', 'netflix', 'spotify', 'twitch', 'hotstar', 'prime']):
-            return "AudioVideo;Audio;Video;Player;"
+        return self.classify(url)[1]
         
-        # Development Sites
-        elif any(site in url_lower for site in ['github', 'stackoverflow', 'gitlab', 'chatgpt', 'deepseek', 'gemini']):
-            return "Development;IDE;"
-        
-        # Social Media
-        elif any(site in url_lower for site in ['twitch', 'twitter', 'x', 'facebook', 'linkedin', 'reddit', 'instagram']):
-            return "Network;Chat;InstantMessaging;"
-        
-        # Shopping
-        elif any(site in url_lower for site in ['amazon', 'flipkart', 'ebay', 'shopping']):
-            return "Network;WebBrowser;"
-        
-        # Communication
-        elif any(site in url_lower for site in ['discord', 'slack', 'teams', 'zoom']):
-            return "Network;Chat;VideoConference;"
+
+    def _resolve_categories_for_url(self, url: str, url_lower: str) -> str:
+        """Resolve the Desktop File Categories for a URL without consulting the cache."""
+        # Known site keywords
+        for pattern, categories in self._category_rules:
+            if pattern.search(url_lower):
+                return categories
         
         # Local files
-        elif url_lower.startswith('file://') or os.path.isabs(url):
+        if url_lower.startswith('file://') or os.path.isabs(url):
             return "System;FileManager;"
         
         # Default Category
@@ -6,19 +6,75 @@ This module handles the creation and management of .desktop files for KRunner sh
 
 import os
 import subprocess
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
-import shutil
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .config import Config
-from .utils import validate_url, sanitize_filename, validate_shortcut_name, format_exec_command
+from .utils import (validate_url, sanitize_filename, validate_shortcut_name, format_exec_command,
+                    parse_exec_command)
+
+# Directories with fewer .desktop files than this are read serially; below it the
+# thread pool's startup costs more than the overlapped reads save
+_PARALLEL_READ_MIN_FILES = 1000
 
 
 class DesktopFileCreator:
     """Class to handle creation of .desktop files for KRunner shortcuts."""
     
     def __init__(self):
-        self.config = Config()
+        self.config = Config.instance()
+        
+        # Applications dirs already known to exist (skips mkdir on repeat creates)
+        self._known_dirs = set()
+        
+        # Resolved .desktop paths per (name, mode)
+        self._path_cache: Dict[Tuple[str, str], Path] = {}
+        
+        # Shortcut names per applications dir, keyed on the dir's mtime
+        self._list_cache: Dict[Path, Tuple[int, List[str]]] = {}
+        
+        # Parsed details per .desktop file, keyed on the file's (mtime, size)
+        self._details_cache: Dict[Path, Tuple[int, int, dict]] = {}
+        
+        # KRunner rebuild suppression for begin_batch()/end_batch()
+        self._batch_depth = 0
+        self._rebuild_pending = False
+    
+    def begin_batch(self) -> None:
+        """Start deferring KRunner database rebuilds until end_batch()."""
+        self._batch_depth += 1
+    
+    def end_batch(self) -> bool:
+        """
+        Finish a batch started with begin_batch().
+        
+        When the outermost batch ends, a single KRunner database rebuild runs
+        if any operation inside the batch requested one.
+        
+        Returns:
+            False if the rebuild was needed but could not be started, True otherwise
+        """
+        if self._batch_depth > 0:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._rebuild_pending:
+            self._rebuild_pending = False
+            return self._update_krunner_database()
+        return True
+    
+    @contextmanager
+    def batch(self) -> Iterator["DesktopFileCreator"]:
+        """
+        Group several shortcut operations under a single KRunner database rebuild.
+        
+        Context manager wrapper around begin_batch()/end_batch(). Batches may be nested.
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
     
     def create_shortcut(self, name: str, description: str, url: str, 
                        browser_command: str = "xdg-open", mode: str = "user") -> bool:
@@ -46,18 +102,9 @@ class DesktopFileCreator:
                 print(f"Error: Invalid URL or path: {url}")
                 return False
             
-            # Sanitize the name for use as filename
-            filename = sanitize_filename(name) + ".desktop"
-            
-            # Get target directory
-            target_dir = self.config.get_applications_dir(mode)
-            target_path = target_dir / filename
-            
-            # Check if file already exists
-            if target_path.exists():
-                # In a real GUI app, this would show a dialog
-                # For now, we'll overwrite
-                pass
+            # Sanitized filename inside the target directory
+            target_path = self._get_shortcut_path(name, mode)
+            target_dir = target_path.parent
             
             # Create the .desktop file content
             desktop_content = self._create_desktop_content(
@@ -67,15 +114,28 @@ class DesktopFileCreator:
                 browser_command=browser_command
             )
             
-            # Ensure target directory exists
-            target_dir.mkdir(parents=True, exist_ok=True)
+            # Ensure target directory exists (once per directory)
+            if target_dir not in self._known_dirs:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(target_dir)
             
-            # Write the .desktop file
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write(desktop_content)
-            
-            # Make the file executable
-            os.chmod(target_path, 0o755)
+            # Write to a temp file and rename over the target so KRunner never
+            # sees a partially written .desktop file
+            temp_path = target_path.with_suffix('.desktop.tmp')
+            data = desktop_content.encode('utf-8')
+            try:
+                try:
+                    self._write_executable(temp_path, data)
+                except FileNotFoundError:
+                    # The directory vanished since it was created; recreate it and retry once
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                    self._write_executable(temp_path, data)
+                os.replace(temp_path, target_path)
+            except OSError:
+                temp_path.unlink(missing_ok=True)
+                raise
+            self._list_cache.pop(target_dir, None)
+            self._details_cache.pop(target_path, None)
             
             # Update KRunner database
             self._update_krunner_database()
@@ -86,6 +146,28 @@ class DesktopFileCreator:
             print(f"Error creating shortcut: {e}")
             return False
     
+    def _get_shortcut_path(self, name: str, mode: str) -> Path:
+        """Get the .desktop file path for a shortcut name, memoized per (name, mode)."""
+        key = (name, mode)
+        path = self._path_cache.get(key)
+        if path is None:
+            filename = sanitize_filename(name) + ".desktop"
+            path = self._path_cache[key] = self.config.get_applications_dir(mode) / filename
+        return path
+    
+    @staticmethod
+    def _write_executable(path: Path, data: bytes) -> None:
+        """Write data to path as an executable (0o755) file."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            # The umask may have stripped bits from the open() mode; fix them on the open fd
+            os.fchmod(fd, 0o755)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
     def _create_desktop_content(self, name: str, description: str, 
                                url: str, browser_command: str) -> str:
         """Create the content for the .desktop file."""
@@ -93,53 +175,74 @@ class DesktopFileCreator:
         exec_command = format_exec_command(browser_command, url)
         
         # Determine appropriate icon and categories based on URL
-        icon = self.config.get_icon_for_url(url)
-        categories = self.config.get_categories_for_url(url)
+        icon, categories = self.config.classify(url)
         
         # Use config template for consistency
-        content = self.config.desktop_template.format(
-            name=name,
-            description=description,
-            exec_command=exec_command,
-            icon=icon,
-            categories=categories
-        )
+        content = self.config.desktop_template % {
+            'name': name,
+            'description': description,
+            'exec_command': exec_command,
+            'icon': icon,
+            'categories': categories,
+        }
         
         return content
     
     def _update_krunner_database(self) -> bool:
-        """Update KRunner's database to include the new shortcut."""
-        try:
-            # Try each kbuildsycoca command from config
-            for command in self.config.kbuildsycoca_commands:
-                try:
-                    result = subprocess.run([command, '--noincremental'], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        return True
-                except FileNotFoundError:
-                    continue
-            
+        """
+        Update KRunner's database to include the new shortcut.
+        
+        The rebuild runs in the background, so its exit status is only reported
+        as a warning once it finishes.
+        
+        Returns:
+            True if the rebuild was started (or deferred by a batch), False otherwise
+        """
+        # Inside batch(): remember the request and rebuild once on exit
+        if self._batch_depth:
+            self._rebuild_pending = True
+            return True
+        
+        # kbuildsycoca binary resolved once per process from config
+        command = self.config.kbuildsycoca_command
+        if command is None:
             return False
-            
-        except subprocess.TimeoutExpired as e:
+        
+        # The rebuild can take seconds, so don't block the caller on it
+        try:
+            proc = subprocess.Popen([command, '--noincremental'],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError as e:
             print(f"Warning: Could not update KRunner database: {e}")
             print("You may need to log out and back in for the shortcut to appear.")
             return False
+        
+        # Reap the child from a daemon thread so it never lingers as a zombie
+        threading.Thread(target=self._wait_for_rebuild, args=(proc,), daemon=True).start()
+        return True
+    
+    @staticmethod
+    def _wait_for_rebuild(proc: subprocess.Popen) -> None:
+        """Wait for a background kbuildsycoca run and warn if it failed."""
+        if proc.wait() != 0:
+            print(f"Warning: KRunner database rebuild exited with status {proc.returncode}")
+            print("You may need to log out and back in for the shortcut to appear.")
     
     def remove_shortcut(self, name: str, mode: str = "user") -> bool:
         """Remove an existing shortcut."""
         try:
-            filename = sanitize_filename(name) + ".desktop"
-            target_dir = self.config.get_applications_dir(mode)
-            target_path = target_dir / filename
+            target_path = self._get_shortcut_path(name, mode)
             
-            if target_path.exists():
+            # unlink() doubles as the existence check - no separate stat
+            try:
                 target_path.unlink()
-                self._update_krunner_database()
-                return True
+            except FileNotFoundError:
+                return False
             
-            return False
+            self._list_cache.pop(target_path.parent, None)
+            self._details_cache.pop(target_path, None)
+            self._update_krunner_database()
+            return True
             
         except Exception as e:
             print(f"Error removing shortcut: {e}")
@@ -149,73 +252,125 @@ class DesktopFileCreator:
         """List existing custom shortcuts."""
         try:
             target_dir = self.config.get_applications_dir(mode)
-            if not target_dir.exists():
+            
+            # One stat answers both "does it exist" and "has it changed"
+            try:
+                mtime = target_dir.stat().st_mtime_ns
+            except FileNotFoundError:
                 return []
             
-            shortcuts = []
-            for desktop_file in target_dir.glob("*.desktop"):
-                try:
-                    with open(desktop_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        # Extract Name field
-                        for line in content.split('\n'):
-                            if line.startswith('Name='):
-                                name = line.split('=', 1)[1]
-                                shortcuts.append(name)
-                                break
-                except Exception:
-                    continue
-            
-            return shortcuts
+            # Unchanged directory (no entries added/removed/renamed) -> reuse last scan
+            cached = self._list_cache.get(target_dir)
+            if cached and cached[0] == mtime:
+                return list(cached[1])
+            
+            # scandir's DirEntry carries the file type, so filtering needs no extra stat
+            with os.scandir(target_dir) as entries:
+                desktop_files = [entry.path for entry in entries
+                                 if entry.name.endswith('.desktop') and entry.is_file()]
+            
+            # Read the small desktop files; map() keeps directory order either way.
+            # Only very large directories on multi-core machines use the thread pool.
+            if len(desktop_files) >= _PARALLEL_READ_MIN_FILES and (os.cpu_count() or 1) > 1:
+                # Imported here so normal startups don't pay for concurrent.futures
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    names = executor.map(self._read_shortcut_name, desktop_files)
+                    shortcuts = [name for name in names if name is not None]
+            else:
+                names = map(self._read_shortcut_name, desktop_files)
+                shortcuts = [name for name in names if name is not None]
+            
+            self._list_cache[target_dir] = (mtime, shortcuts)
+            return list(shortcuts)
             
         except Exception as e:
             print(f"Error listing shortcuts: {e}")
             return []
 
+    @staticmethod
+    def _read_shortcut_name(desktop_file: str) -> Optional[str]:
+        """Return the Name field of a .desktop file, or None if unreadable."""
+        try:
+            with open(desktop_file, 'r', encoding='utf-8') as f:
+                # Stream lines and stop at the Name field
+                for line in f:
+                    if line.startswith('Name='):
+                        return line[5:].rstrip('\r\n')
+        except Exception:
+            pass
+        return None
+
     def get_shortcut_details(self, name: str, mode: str = "user") -> dict:
         """Get details of an existing shortcut."""
         try:
-            filename = sanitize_filename(name) + ".desktop"
-            target_dir = self.config.get_applications_dir(mode)
-            target_path = target_dir / filename
+            target_path = self._get_shortcut_path(name, mode)
             
-            if not target_path.exists():
+            try:
+                st = target_path.stat()
+            except FileNotFoundError:
                 return {}
             
-            details = {}
-            with open(target_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                for line in content.split('\n'):
-                    if line.startswith('Name='):
-                        details['name'] = line.split('=', 1)[1]
-                    elif line.startswith('GenericName='):
-                        details['description'] = line.split('=', 1)[1]
-                    elif line.startswith('Exec='):
-                        exec_line = line.split('=', 1)[1]
-                        # Extract URL from exec command
-                        if 'xdg-open' in exec_line:
-                            # Extract URL from xdg-open command
-                            parts = exec_line.split('"')
-                            if len(parts) >= 2:
-                                details['url'] = parts[1]
-                            details['browser_command'] = 'xdg-open'
-                        else:
-                            # Custom browser
-                            parts = exec_line.split('"')
-                            if len(parts) >= 3:
-                                details['browser_command'] = parts[0].strip()
-                                details['url'] = parts[1]
-                            elif len(parts) >= 2:
-                                details['url'] = parts[1]
-                                details['browser_command'] = 'custom'
-                    elif line.startswith('Comment='):
-                        comment = line.split('=', 1)[1]
-                        if comment.startswith('Open - '):
-                            details['description'] = comment[7:]
-                        
-            return details
+            # Reuse the last parse while the file's mtime and size are unchanged
+            cached = self._details_cache.get(target_path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return dict(cached[2])
+            
+            details = self._parse_desktop_file(target_path)
+            self._details_cache[target_path] = (st.st_mtime_ns, st.st_size, details)
+            return dict(details)
             
         except Exception as e:
             print(f"Error getting shortcut details: {e}")
             return {}
+
+    @staticmethod
+    def _parse_desktop_file(path: Path) -> dict:
+        """Parse the [Desktop Entry] group of a .desktop file into shortcut details."""
+        entry = {}
+        found = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                # Stream lines, keeping only keys inside the [Desktop Entry] group
+                in_entry = False
+                for line in f:
+                    line = line.strip()
+                    if not line or line[0] == '#':
+                        continue
+                    if line[0] == '[':
+                        if in_entry:
+                            # Later groups (e.g. desktop actions) are not needed
+                            break
+                        in_entry = found = line == '[Desktop Entry]'
+                        continue
+                    if in_entry:
+                        key, sep, value = line.partition('=')
+                        if sep:
+                            entry[key.rstrip()] = value.lstrip()
+        except OSError:
+            return {}
+        if not found:
+            return {}
+        
+        details = {}
+        if 'Name' in entry:
+            details['name'] = entry['Name']
+        if 'GenericName' in entry:
+            details['description'] = entry['GenericName']
+        
+        if 'Exec' in entry:
+            # Exec is "<browser command> <url>", quoted per the Desktop Entry spec
+            args = parse_exec_command(entry['Exec'])
+            
+            if len(args) >= 2:
+                details['browser_command'] = ' '.join(args[:-1])
+                details['url'] = args[-1]
+            elif args:
+                details['browser_command'] = args[0]
+        
+        # Prefer the description embedded in our own Comment format
+        comment = entry.get('Comment', '')
+        if comment.startswith('Open - '):
+            details['description'] = comment[7:]
+        
+        return details
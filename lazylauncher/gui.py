@@ -5,13 +5,16 @@ This Module contains the main GUI Interface for creating, updating, and deleting
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk
 from typing import Optional
 
 from .creator import DesktopFileCreator
 from .config import Config
 from .utils import validate_browser_command
 
+# messagebox and filedialog are imported inside the handlers that use them,
+# keeping the dialog modules off the startup path
+
 class LazyLauncherGUI:
     """Main GUI Class for LazyLauncher"""
 
@@ -32,19 +35,8 @@ class LazyLauncherGUI:
         self.style.map('Create.TButton',
                       background=[('active', '#45a049')])
         
-        self.style.configure('Delete.TButton', 
-                           background='#f44336', 
-                           foreground='white',
-                           font=('Arial', 9, 'bold'))
-        self.style.map('Delete.TButton',
-                      background=[('active', '#da190b')])
-        
-        self.style.configure('Update.TButton', 
-                           background='#2196F3', 
-                           foreground='white',
-                           font=('Arial', 9, 'bold'))
-        self.style.map('Update.TButton',
-                      background=[('active', '#1976D2')])
+        # Delete/Update styles are only used on the manage tab - configured on first visit
+        self._manage_styles_done = False
         
         self.style.configure('Secondary.TButton', 
                            background='#6c757d', 
@@ -53,9 +45,13 @@ class LazyLauncherGUI:
         self.style.map('Secondary.TButton',
                       background=[('active', '#545b62')])
 
-        self.config = Config()
+        # Shared Config - the creator uses the same instance
+        self.config = Config.instance()
         self.creator = DesktopFileCreator()
 
+        # Pending debounced search filter (Tk after() id)
+        self._search_after_id = None
+
         self.setup_gui()
 
     def setup_gui(self):
@@ -79,6 +75,7 @@ class LazyLauncherGUI:
         
         self.notebook.add(self.create_tab, text="Create Shortcut")
         self.notebook.add(self.manage_tab, text="Manage Shortcuts")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Setup individual tabs
         self.setup_create_tab()
@@ -88,6 +85,31 @@ class LazyLauncherGUI:
         main_frame.columnconfigure(0, weight=1)
         main_frame.rowconfigure(1, weight=1)
 
+    def _on_tab_changed(self, event=None):
+        """Configure manage tab styles the first time that tab is shown"""
+        if self.notebook.select() == str(self.manage_tab):
+            self._configure_manage_styles()
+
+    def _configure_manage_styles(self):
+        """Configure the Delete/Update button styles (once)"""
+        if self._manage_styles_done:
+            return
+        self._manage_styles_done = True
+        
+        self.style.configure('Delete.TButton', 
+                           background='#f44336', 
+                           foreground='white',
+                           font=('Arial', 9, 'bold'))
+        self.style.map('Delete.TButton',
+                      background=[('active', '#da190b')])
+        
+        self.style.configure('Update.TButton', 
+                           background='#2196F3', 
+                           foreground='white',
+                           font=('Arial', 9, 'bold'))
+        self.style.map('Update.TButton',
+                      background=[('active', '#1976D2')])
+
     def setup_create_tab(self):
         """Setup the Create Shortcut tab"""
         create_frame = ttk.Frame(self.create_tab, padding="20")
@@ -226,29 +248,53 @@ class LazyLauncherGUI:
         
         # Load shortcuts initially
         self.all_shortcuts = []
+        self._all_shortcuts_lower = []  # Lowercased names, parallel to all_shortcuts
+        self._displayed = []  # Rows currently shown in the listbox
         self.refresh_shortcuts()
 
     def refresh_shortcuts(self):
         """Refresh the shortcuts list"""
-        self.shortcuts_listbox.delete(0, tk.END)
         self.all_shortcuts = self.creator.list_shortcuts(self.manage_mode_var.get())
+        self._all_shortcuts_lower = [shortcut.lower() for shortcut in self.all_shortcuts]
         self.filter_shortcuts()
 
     def filter_shortcuts(self):
-        """Filter shortcuts based on search term"""
-        self.shortcuts_listbox.delete(0, tk.END)
+        """Filter shortcuts based on search term, touching only the rows that changed"""
         search_term = self.search_var.get().lower()
+        matches = [shortcut for shortcut, lowered in zip(self.all_shortcuts, self._all_shortcuts_lower)
+                   if search_term in lowered]
         
-        for shortcut in self.all_shortcuts:
-            if search_term == "" or search_term in shortcut.lower():
-                self.shortcuts_listbox.insert(tk.END, shortcut)
+        if matches == self._displayed:
+            return
+        
+        # Keep the unchanged leading rows, replace everything after them
+        common = 0
+        for old, new in zip(self._displayed, matches):
+            if old != new:
+                break
+            common += 1
+        
+        self.shortcuts_listbox.delete(common, tk.END)
+        if len(matches) > common:
+            # One Tcl call for all new rows
+            self.shortcuts_listbox.insert(tk.END, *matches[common:])
+        self._displayed = matches
 
     def on_search_change(self, *args):
-        """Handle search text changes"""
+        """Handle search text changes, coalescing bursts of keystrokes into one filter pass"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._run_search_filter)
+
+    def _run_search_filter(self):
+        """Run the debounced search filter"""
+        self._search_after_id = None
         self.filter_shortcuts()
 
     def update_shortcut(self):
         """Update the selected shortcut"""
+        from tkinter import messagebox
+
         selection = self.shortcuts_listbox.curselection()
         if not selection:
             messagebox.showwarning("Warning", "Please select a shortcut to update.")
@@ -264,20 +310,8 @@ class LazyLauncherGUI:
         # Switch to create tab and populate with current values
         self.notebook.select(self.create_tab)
         
-        # Clear and populate form
-        self.clear_form()
-        self.name_entry.insert(0, details.get('name', ''))
-        self.description_entry.insert(0, details.get('description', ''))
-        self.url_entry.insert(0, details.get('url', ''))
-        
-        if details.get('browser_command') == 'xdg-open':
-            self.browser_var.set('default')
-        else:
-            self.browser_var.set('custom')
-            self.browser_path_entry.delete(0, tk.END)
-            self.browser_path_entry.insert(0, details.get('browser_command', ''))
-        
-        self.mode_var.set(self.manage_mode_var.get())
+        # Populate form (each widget/variable written once)
+        self._populate_form(details, self.manage_mode_var.get())
         
         messagebox.showinfo("Update Mode", 
                            f"Shortcut '{shortcut_name}' loaded for editing.\n\n"
@@ -285,6 +319,8 @@ class LazyLauncherGUI:
 
     def delete_shortcut(self):
         """Delete the selected shortcut"""
+        from tkinter import messagebox
+
         selection = self.shortcuts_listbox.curselection()
         if not selection:
             messagebox.showwarning("Warning", "Please select a shortcut to delete.")
@@ -300,7 +336,12 @@ class LazyLauncherGUI:
             
             if success:
                 messagebox.showinfo("Success", f"Shortcut '{shortcut_name}' deleted successfully!")
-                self.refresh_shortcuts()
+                # We know exactly what changed - drop it instead of rescanning the directory
+                if shortcut_name in self.all_shortcuts:
+                    index = self.all_shortcuts.index(shortcut_name)
+                    del self.all_shortcuts[index]
+                    del self._all_shortcuts_lower[index]
+                self.filter_shortcuts()
             else:
                 messagebox.showerror("Error", f"Failed to delete shortcut '{shortcut_name}'.")
 
@@ -315,6 +356,8 @@ class LazyLauncherGUI:
     
     def browse_browser(self):
         """Open file dialog to select custom browser."""
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             title="Select Browser Executable",
             filetypes=[
@@ -328,6 +371,8 @@ class LazyLauncherGUI:
     
     def create_shortcut(self):
         """Create the desktop shortcut."""
+        from tkinter import messagebox
+
         # Validate inputs
         name = self.name_entry.get().strip()
         description = self.description_entry.get().strip()
@@ -353,30 +398,60 @@ class LazyLauncherGUI:
                 return
             browser_command = browser_path
         
-        # Create shortcut
+        # Create shortcut (KRunner refresh deferred to the end of the batch)
+        mode = self.mode_var.get()
         try:
-            success = self.creator.create_shortcut(
-                name=name,
-                description=description,
-                url=url,
-                browser_command=browser_command,
-                mode=self.mode_var.get()
-            )
+            with self.creator.batch():
+                success = self.creator.create_shortcut(
+                    name=name,
+                    description=description,
+                    url=url,
+                    browser_command=browser_command,
+                    mode=mode
+                )
             
             if success:
                 messagebox.showinfo("Success", 
                                   f"Shortcut '{name}' created successfully!\n\n"
                                   f"You can now use 'Alt+SPACE' and type '{name}' to launch it.")
                 self.clear_form()
-                # Refresh the manage tab if it's the same mode
-                if hasattr(self, 'manage_mode_var') and self.manage_mode_var.get() == self.mode_var.get():
-                    self.refresh_shortcuts()
+                # Add it to the manage tab if it's the same mode (no directory rescan needed)
+                if hasattr(self, 'manage_mode_var') and self.manage_mode_var.get() == mode:
+                    if name not in self.all_shortcuts:
+                        self.all_shortcuts.append(name)
+                        self._all_shortcuts_lower.append(name.lower())
+                    self.filter_shortcuts()
             else:
                 messagebox.showerror("Error", "Failed to create shortcut!")
                 
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
     
+    def _populate_form(self, details: dict, mode: str):
+        """
+        Fill the create form from shortcut details.
+        
+        Sets every field directly instead of clear_form() followed by inserts, so the
+        browser/mode variables (and their traces) change once rather than twice.
+        Tk already coalesces the resulting redraws into a single idle repaint.
+        """
+        for entry, value in ((self.name_entry, details.get('name', '')),
+                             (self.description_entry, details.get('description', '')),
+                             (self.url_entry, details.get('url', ''))):
+            entry.delete(0, tk.END)
+            entry.insert(0, value)
+        
+        if details.get('browser_command') == 'xdg-open':
+            # Clear while the path entry may still be enabled, then disable it
+            self.browser_path_entry.delete(0, tk.END)
+            self.browser_var.set('default')
+        else:
+            self.browser_var.set('custom')
+            self.browser_path_entry.delete(0, tk.END)
+            self.browser_path_entry.insert(0, details.get('browser_command', ''))
+        
+        self.mode_var.set(mode)
+    
     def clear_form(self):
         """Clear all form fields."""
         self.name_entry.delete(0, tk.END)
@@ -6,10 +6,86 @@ This module contains helper functions for URL Validation, file operations, etc.
 
 import re
 import os
+import stat
+import string
 import urllib.parse
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
+# Characters allowed in generated filenames; every other ASCII character maps to '_'
+_FILENAME_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + '._-')
+_SANITIZE_TABLE = str.maketrans({chr(i): '_' for i in range(128) if chr(i) not in _FILENAME_SAFE_CHARS})
+
+# Precompiled sanitize_filename patterns
+_INVALID_CHARS_RE = re.compile(r'[^a-zA-Z0-9._-]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# Plain http(s) URL with a non-empty host; anything unusual goes to urlsplit
+_SIMPLE_HTTP_URL_RE = re.compile(r"https?://[A-Za-z0-9._~%!$&'()*+,;=:@-]+(?:[/?#]|$)")
+
+# Characters not allowed in shortcut names
+_INVALID_SHORTCUT_CHARS = frozenset('/\\:*?"<>|')
+
+# Units for get_file_size_human, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Desktop Entry Exec quoting: arguments with reserved characters go in double
+# quotes, where '"', '`', '$' and '\\' are backslash-escaped
+_EXEC_RESERVED_CHARS = frozenset(' \t\n"\'\\><~|&;$*?#()`')
+_EXEC_ESCAPE_RE = re.compile(r'(["`$\\])')
+
+# Escape sequences of the Desktop Entry string type, applied after quoting and
+# undone before Exec is split
+_DESKTOP_STRING_TABLE = str.maketrans({'\\': '\\\\', '\n': '\\n', '\r': '\\r'})
+_DESKTOP_STRING_ESCAPES = {'s': ' ', 'n': '\n', 't': '\t', 'r': '\r', '\\': '\\'}
+_DESKTOP_STRING_ESCAPE_RE = re.compile(r'\\(.)')
+
+# Browsers found by get_common_browser, filled on first call
+_cached_browsers: Optional[list[dict]] = None
+
+@lru_cache(maxsize=128)
+def _validate_url_pure(url: str) -> Optional[bool]:
+    """
+    Validate the parts of a URL that don't depend on the filesystem.
+
+    Args:
+        url: The stripped URL or path to validate
+
+    Returns:
+        True or False when the string alone decides, None when the
+        filesystem has to be checked
+    """
+    # Parse once and branch on the result
+    try:
+        result = urllib.parse.urlsplit(url)
+    except Exception:
+        result = None
+    
+    # Check if it's a valid HTTP/HTTPS URL
+    if result is not None and result.scheme in ('http', 'https') and result.netloc:
+        return True
+    
+    # file:// URLs and absolute paths need an existence check
+    if url.startswith('file://'):
+        return None if result is not None else False
+    if os.path.isabs(url):
+        return None
+    
+    # Check for other protocols (ftp, mailto, etc.)
+    if result is not None and result.scheme and result.scheme not in ('http', 'https', 'file'):
+        # Basic validation for other protocols
+        if result.scheme in ('ftp', 'ftps') and result.netloc:
+            return True
+        elif result.scheme == 'mailto' and '@' in result.path:
+            return True
+        elif result.scheme in ('tel', 'sms') and result.path:
+            return True
+        # Add more protocol validations as needed
+        return bool(result.scheme and (result.netloc or result.path))
+    
+    return False
+
 def validate_url(url: str) -> bool:
     """
     Validate if a given string is a valid URL or file path.
@@ -25,44 +101,28 @@ def validate_url(url: str) -> bool:
     
     url = url.strip()
     
-    # Check if it's a valid HTTP/HTTPS URL
-    try:
-        result = urllib.parse.urlparse(url)
-        if result.scheme in ('http', 'https') and result.netloc:
-            return True
-    except Exception:
-        pass
+    # Most shortcuts are plain web URLs; accept them without parsing
+    if url.startswith(('http://', 'https://')) and _SIMPLE_HTTP_URL_RE.match(url):
+        return True
+    
+    valid = _validate_url_pure(url)
+    if valid is not None:
+        return valid
     
     # Check if it's a valid file:// URL
     if url.startswith('file://'):
-        try:
-            path = urllib.parse.urlparse(url).path
-            return os.path.exists(path)
-        except Exception:
-            return False
-    
-    # Check if it's a valid absolute path
-    if os.path.isabs(url):
-        return os.path.exists(url)
-    
-    # Check for other protocols (ftp, mailto, etc.)
-    try:
-        result = urllib.parse.urlparse(url)
-        if result.scheme and result.scheme not in ('http', 'https', 'file'):
-            # Basic validation for other protocols
-            if result.scheme in ('ftp', 'ftps') and result.netloc:
-                return True
-            elif result.scheme == 'mailto' and '@' in result.path:
-                return True
-            elif result.scheme in ('tel', 'sms') and result.path:
-                return True
-            # Add more protocol validations as needed
-            return bool(result.scheme and (result.netloc or result.path))
-    except Exception:
-        pass
+        rest = url[7:]
+        if rest.startswith('/'):
+            # No host part, so the path is everything up to the query/fragment
+            path = rest.split('?', 1)[0].split('#', 1)[0]
+        else:
+            path = urllib.parse.urlsplit(url).path
+        return os.path.exists(urllib.parse.unquote(path))
     
-    return False
+    # Otherwise it's an absolute path
+    return os.path.exists(url)
 
+@lru_cache(maxsize=256)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a String to be Safe for use as a filename.
@@ -79,10 +139,14 @@ def sanitize_filename(filename: str) -> str:
     
     # Remove or Replace Invalid Characters
     # Keep Alphanumeric, Hyphens, Underscores and dots
-    sanitized = re.sub(r'[^a-zA-Z0-9._-]', '_', filename.strip())
+    sanitized = filename.strip().translate(_SANITIZE_TABLE)
+    if not sanitized.isascii():
+        # The table only covers ASCII; non-ASCII characters are replaced here
+        sanitized = _INVALID_CHARS_RE.sub('_', sanitized)
 
     # Remove multiple consecutive Underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    if '__' in sanitized:
+        sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized)
 
     # Remove leading/trailing Underscores and dots
     sanitized = sanitized.strip('_.')
@@ -138,17 +202,24 @@ def is_executable(path: Union[str, Path]) -> bool:
         True if file is executable, False otherwise
     """
 
+    # One stat for the file type (Path.is_file() would hide it behind its own stat),
+    # then an access() check so execute permission is judged for the current user
     try:
-        path = Path(path)
-        return path.is_file() and os.access(path, os.X_OK)
-    except Exception:
+        if not stat.S_ISREG(os.stat(path).st_mode):
+            return False
+        return os.access(path, os.X_OK)
+    except (OSError, ValueError):
         return False
     
 
+@lru_cache(maxsize=256)
 def find_executable(command: str) -> Optional[str]:
     """
     Find the full path to an executable command.
 
+    Results are cached, so PATH changes made while the process is
+    running are not picked up.
+
     Args:
         command: The Command to Find
 
@@ -174,18 +245,16 @@ def get_file_size_human(path: Union[str, Path]) -> str:
         Human-readable file size string
     """
     try:
-        size = Path(path).stat().st_size
-        
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
+        size = os.stat(path).st_size
         
-        return f"{size:.1f} TB"
+        # Each unit covers 10 more bits of the size
+        idx = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
     except Exception:
         return "Unknown"
     
 
+@lru_cache(maxsize=128)
 def extract_domain(url: str) -> Optional[str]:
     """
     Extract domain name from a URL.
@@ -198,7 +267,7 @@ def extract_domain(url: str) -> Optional[str]:
     """
 
     try:
-        parsed = urllib.parse.urlparse(url)
+        parsed = urllib.parse.urlsplit(url)
         domain = parsed.netloc.lower()
 
         # Remove www. prefix if present
@@ -221,17 +290,95 @@ def format_exec_command(browser_command: str, url: str) -> str:
     Returns:
         Properly formatted Exec command
     """
-    # Escape special characters in URL
-    escaped_url = url.replace('"', '\\"').replace("'", "\\'")
+    # Quote the URL per the Desktop Entry spec (only when needed)
+    quoted_url = _quote_exec_arg(url)
     
+    # Default browser needs no quoting
     if browser_command == "xdg-open":
-        return f"xdg-open \"{escaped_url}\""
-    else:
-        # For custom browsers, add the URL as an argument
-        # Handle spaces in browser path
-        if ' ' in browser_command and not (browser_command.startswith('"') and browser_command.endswith('"')):
-            browser_command = f'"{browser_command}"'
-        return f"{browser_command} \"{escaped_url}\""
+        return f"xdg-open {quoted_url}"
+    
+    # Quote the browser path the same way, unless already quoted by the caller
+    if not (browser_command.startswith('"') and browser_command.endswith('"')):
+        browser_command = _quote_exec_arg(browser_command)
+    return f"{browser_command} {quoted_url}"
+
+
+def _quote_exec_arg(arg: str) -> str:
+    """
+    Quote a single argument for a .desktop Exec line.
+
+    Follows the Desktop Entry spec: a literal '%' is written as '%%', and
+    arguments containing reserved characters are wrapped in double quotes
+    with '"', '`', '$' and '\\' backslash-escaped. The string-type escaping
+    of Exec values goes on top (backslashes doubled, newlines as \\n).
+
+    Args:
+        arg: The argument to quote
+
+    Returns:
+        The argument as it should appear in the Exec value
+    """
+    arg = arg.replace('%', '%%')
+    if not (arg and _EXEC_RESERVED_CHARS.isdisjoint(arg)):
+        arg = '"' + _EXEC_ESCAPE_RE.sub(r'\\\1', arg) + '"'
+    return arg.translate(_DESKTOP_STRING_TABLE)
+
+
+def parse_exec_command(exec_value: str) -> list[str]:
+    """
+    Split a .desktop Exec value into its arguments.
+
+    Reverses format_exec_command: undoes the string-type escapes, splits on
+    unquoted whitespace, removes double-quote quoting and turns '%%' back
+    into '%'. Single-quoted arguments, as written by older LazyLauncher
+    versions, are also accepted.
+
+    Args:
+        exec_value: The raw Exec value from the .desktop file
+
+    Returns:
+        List of arguments (empty if the value is malformed)
+    """
+    value = _DESKTOP_STRING_ESCAPE_RE.sub(
+        lambda m: _DESKTOP_STRING_ESCAPES.get(m.group(1), m.group(0)), exec_value)
+
+    args = []
+    current = []
+    in_arg = False
+    i = 0
+    while i < len(value):
+        char = value[i]
+        if char in ' \t\n':
+            if in_arg:
+                args.append(''.join(current))
+                current = []
+                in_arg = False
+        elif char == '"':
+            end = i + 1
+            while end < len(value) and value[end] != '"':
+                if value[end] == '\\' and end + 1 < len(value):
+                    end += 1
+                current.append(value[end])
+                end += 1
+            if end >= len(value):
+                return []
+            i = end
+            in_arg = True
+        elif char == "'":
+            end = value.find("'", i + 1)
+            if end == -1:
+                return []
+            current.append(value[i + 1:end])
+            i = end
+            in_arg = True
+        else:
+            current.append(char)
+            in_arg = True
+        i += 1
+    if in_arg:
+        args.append(''.join(current))
+
+    return [arg.replace('%%', '%') for arg in args]
     
 
 def validate_shortcut_name(name: str) -> tuple[bool, str]:
@@ -251,30 +398,32 @@ def validate_shortcut_name(name: str) -> tuple[bool, str]:
     name = name.strip()
 
     # Check Length
-    if len(name) < 1:
-        return False, "Shortcut Name must be at least 1 character long"
-    
     if len(name) > 50:
         return False, "Shortcut name must be 50 characters or less"
     
     # Check for invalid characters (basic check)
-    if any(char in name for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|']):
+    if not _INVALID_SHORTCUT_CHARS.isdisjoint(name):
         return False, "Shortcut name contains invalid characters"
     
-    # Check if it starts/ends with Whitespace
-    if name != name.strip():
-        return False, "Shortcut name cannot start or end with whitespace"
-    
     return True, ""
 
 
-def get_common_browser() -> list[dict]:
+def get_common_browser(refresh: bool = False) -> list[dict]:
     """
     Get a list of commonly available browser on Linux.
 
+    The PATH lookup runs once per process; later calls reuse the result.
+
+    Args:
+        refresh: Search PATH again instead of using the cached result
+
     Returns: 
         List of browser dictionaries with name and command
     """
+    global _cached_browsers
+
+    if _cached_browsers is not None and not refresh:
+        return list(_cached_browsers)
 
     browsers = [
         {"name": "Default Browser", "command": "xdg-open"},
@@ -300,7 +449,8 @@ def get_common_browser() -> list[dict]:
             # Skip browsers that cause errors during detection
             continue
 
-    return available_browsers
+    _cached_browsers = available_browsers
+    return list(available_browsers)
 
 
 def validate_browser_command(command: str) -> bool:
@@ -316,8 +466,20 @@ def validate_browser_command(command: str) -> bool:
     if not command or not command.strip():
         return False
     
-    command = command.strip()
-    
+    return _resolve_browser(command.strip())
+
+
+@lru_cache(maxsize=256)
+def _resolve_browser(command: str) -> bool:
+    """
+    Look up a stripped browser command, caching the result per process.
+
+    Args:
+        command: The browser command to look up
+
+    Returns:
+        True if browser is available, False otherwise
+    """
     # Default system command is always valid
     if command == "xdg-open":
         return True
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Generate lazylauncher/_site_icons_data.py from assets/site_icons.json.
+
+The generated module lets Config import the site icon table as a compiled
+constant instead of parsing JSON at runtime. Re-run this script whenever
+assets/site_icons.json changes.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+SOURCE_FILE = ROOT_DIR / "assets" / "site_icons.json"
+OUTPUT_FILE = ROOT_DIR / "lazylauncher" / "_site_icons_data.py"
+
+HEADER = '''"""
+Site icon mappings for LazyLauncher.
+
+Generated by scripts/gen_site_icons.py from assets/site_icons.json - do not edit by hand.
+"""
+
+'''
+
+
+def main() -> int:
+    """Regenerate the site icons data module."""
+    try:
+        with open(SOURCE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: Could not read {SOURCE_FILE}: {e}", file=sys.stderr)
+        return 1
+
+    if not isinstance(data, dict):
+        print(f"Error: {SOURCE_FILE} must contain a JSON object", file=sys.stderr)
+        return 1
+
+    lines = ["SITE_ICONS = {"]
+    for domain, icon in data.items():
+        lines.append(f"    {str(domain)!r}: {str(icon)!r},")
+    lines.append("}")
+
+    OUTPUT_FILE.write_text(HEADER + "\n".join(lines) + "\n", encoding='utf-8')
+    print(f"✓ Wrote {len(data)} site icons to {OUTPUT_FILE.relative_to(ROOT_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,8 +12,27 @@ from pathlib import Path
 # Add parent directory to path to import lazylauncher modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from lazylauncher.config import Config
 from lazylauncher.creator import DesktopFileCreator
-from lazylauncher.utils import validate_url, validate_shortcut_name, validate_browser_command
+from lazylauncher.utils import (validate_url, validate_shortcut_name, validate_browser_command,
+                                sanitize_filename)
+
+# (name, lowercased name) pairs per mode for search; cleared when shortcuts change
+_lowered_index_cache: dict[str, list[tuple[str, str]]] = {}
+
+
+def _get_lowered_index(creator: DesktopFileCreator, mode: str) -> list[tuple[str, str]]:
+    """Return (name, lowercased name) pairs for the shortcuts in a mode."""
+    index = _lowered_index_cache.get(mode)
+    if index is None:
+        index = [(name, name.lower()) for name in creator.list_shortcuts(mode)]
+        _lowered_index_cache[mode] = index
+    return index
+
+
+def _invalidate_lowered_index(mode: str) -> None:
+    """Drop the cached search index for a mode after its shortcuts change."""
+    _lowered_index_cache.pop(mode, None)
 
 
 def main():
@@ -46,8 +65,27 @@ Examples:
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    # Create shortcut command
-    create_parser = subparsers.add_parser("create", help="Create a new shortcut")
+    # Every command is listed in --help, but only the one being run gets its arguments
+    requested = sys.argv[1] if len(sys.argv) > 1 else None
+    for name, (help_text, add_arguments, _) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name == requested:
+            add_arguments(command_parser)
+    
+    args = parser.parse_args()
+    
+    if not args.command:
+        parser.print_help()
+        return 1
+    
+    creator = DesktopFileCreator()
+    
+    handler = COMMANDS[args.command][2]
+    return handler(creator, args)
+
+
+def _add_create_arguments(create_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the create command."""
     create_parser.add_argument("name", help="Shortcut name (what you type in KRunner)")
     create_parser.add_argument("url", help="URL or path to open")
     create_parser.add_argument("-d", "--description", 
@@ -62,9 +100,10 @@ Examples:
     create_parser.add_argument("-f", "--force", 
                               action="store_true",
                               help="Force overwrite if shortcut exists")
-    
-    # Update shortcut command
-    update_parser = subparsers.add_parser("update", help="Update an existing shortcut")
+
+
+def _add_update_arguments(update_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the update command."""
     update_parser.add_argument("name", help="Name of shortcut to update")
     update_parser.add_argument("-u", "--url", help="New URL or path")
     update_parser.add_argument("-d", "--description", help="New description")
@@ -73,9 +112,10 @@ Examples:
                               choices=["user", "system"], 
                               default="user",
                               help="Installation mode (default: user)")
-    
-    # Remove shortcut command
-    remove_parser = subparsers.add_parser("remove", help="Remove a shortcut")
+
+
+def _add_remove_arguments(remove_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the remove command."""
     remove_parser.add_argument("name", help="Name of shortcut to remove")
     remove_parser.add_argument("-m", "--mode", 
                               choices=["user", "system"], 
@@ -84,9 +124,10 @@ Examples:
     remove_parser.add_argument("-y", "--yes", 
                               action="store_true",
                               help="Skip confirmation prompt")
-    
-    # List shortcuts command
-    list_parser = subparsers.add_parser("list", help="List existing shortcuts")
+
+
+def _add_list_arguments(list_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the list command."""
     list_parser.add_argument("-m", "--mode", 
                             choices=["user", "system", "all"], 
                             default="user",
@@ -94,9 +135,10 @@ Examples:
     list_parser.add_argument("-v", "--verbose", 
                             action="store_true",
                             help="Show detailed information")
-    
-    # Search shortcuts command
-    search_parser = subparsers.add_parser("search", help="Search shortcuts by name")
+
+
+def _add_search_arguments(search_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the search command."""
     search_parser.add_argument("term", help="Search term")
     search_parser.add_argument("-m", "--mode", 
                               choices=["user", "system", "all"], 
@@ -105,37 +147,15 @@ Examples:
     search_parser.add_argument("-v", "--verbose", 
                               action="store_true",
                               help="Show detailed information")
-    
-    # Show shortcut details command
-    show_parser = subparsers.add_parser("show", help="Show detailed information about a shortcut")
+
+
+def _add_show_arguments(show_parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the show command."""
     show_parser.add_argument("name", help="Name of shortcut to show")
     show_parser.add_argument("-m", "--mode", 
                             choices=["user", "system", "all"], 
                             default="all",
                             help="Installation mode (default: all)")
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return 1
-    
-    creator = DesktopFileCreator()
-    
-    if args.command == "create":
-        return create_shortcut(creator, args)
-    elif args.command == "update":
-        return update_shortcut(creator, args)
-    elif args.command == "remove":
-        return remove_shortcut(creator, args)
-    elif args.command == "list":
-        return list_shortcuts(creator, args)
-    elif args.command == "search":
-        return search_shortcuts(creator, args)
-    elif args.command == "show":
-        return show_shortcut(creator, args)
-    
-    return 1
 
 
 def create_shortcut(creator: DesktopFileCreator, args) -> int:
@@ -178,6 +198,7 @@ def create_shortcut(creator: DesktopFileCreator, args) -> int:
         )
         
         if success:
+            _invalidate_lowered_index(args.mode)
             print(f"✓ Successfully created shortcut '{args.name}'")
             print(f"  You can now use Alt+SPACE and type '{args.name}' to launch it.")
             return 0
@@ -231,6 +252,7 @@ def update_shortcut(creator: DesktopFileCreator, args) -> int:
         )
         
         if success:
+            _invalidate_lowered_index(args.mode)
             print(f"✓ Successfully updated shortcut '{args.name}'")
             return 0
         else:
@@ -261,6 +283,7 @@ def remove_shortcut(creator: DesktopFileCreator, args) -> int:
         success = creator.remove_shortcut(args.name, args.mode)
         
         if success:
+            _invalidate_lowered_index(args.mode)
             print(f"✓ Successfully removed shortcut '{args.name}'")
             return 0
         else:
@@ -272,6 +295,24 @@ def remove_shortcut(creator: DesktopFileCreator, args) -> int:
         return 1
 
 
+def _format_shortcut_lines(creator: DesktopFileCreator, mode: str,
+                           shortcuts: list, verbose: bool) -> list[str]:
+    """Format the output lines for one mode's shortcuts in list/search."""
+    if not verbose:
+        return [f"  • {shortcut}" for shortcut in shortcuts]
+    
+    lines = []
+    for shortcut in shortcuts:
+        details = creator.get_shortcut_details(shortcut, mode)
+        lines.append(f"  • {shortcut}")
+        if details:
+            lines.append(f"    Description: {details.get('description', 'N/A')}")
+            lines.append(f"    URL: {details.get('url', 'N/A')}")
+            lines.append(f"    Browser: {details.get('browser_command', 'xdg-open')}")
+        lines.append("")
+    return lines
+
+
 def list_shortcuts(creator: DesktopFileCreator, args) -> int:
     """List existing shortcuts."""
     try:
@@ -281,7 +322,7 @@ def list_shortcuts(creator: DesktopFileCreator, args) -> int:
         for mode in modes_to_check:
             shortcuts = creator.list_shortcuts(mode)
             if shortcuts:
-                all_shortcuts[mode] = shortcuts
+                all_shortcuts[mode] = sorted(shortcuts)
         
         if not all_shortcuts:
             if args.mode == "all":
@@ -295,21 +336,11 @@ def list_shortcuts(creator: DesktopFileCreator, args) -> int:
         print()
         
         for mode, shortcuts in all_shortcuts.items():
-            print(f"📁 {mode.upper()} mode ({len(shortcuts)} shortcuts):")
-            
-            if args.verbose:
-                for shortcut in sorted(shortcuts):
-                    details = creator.get_shortcut_details(shortcut, mode)
-                    print(f"  • {shortcut}")
-                    if details:
-                        print(f"    Description: {details.get('description', 'N/A')}")
-                        print(f"    URL: {details.get('url', 'N/A')}")
-                        print(f"    Browser: {details.get('browser_command', 'xdg-open')}")
-                    print()
-            else:
-                for shortcut in sorted(shortcuts):
-                    print(f"  • {shortcut}")
-            print()
+            # Build each mode's block first and write it in one call
+            lines = [f"📁 {mode.upper()} mode ({len(shortcuts)} shortcuts):"]
+            lines.extend(_format_shortcut_lines(creator, mode, shortcuts, args.verbose))
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         return 0
         
@@ -323,12 +354,13 @@ def search_shortcuts(creator: DesktopFileCreator, args) -> int:
     try:
         modes_to_check = ["user", "system"] if args.mode == "all" else [args.mode]
         found_shortcuts = {}
+        term_lower = args.term.lower()
         
         for mode in modes_to_check:
-            shortcuts = creator.list_shortcuts(mode)
-            matching = [s for s in shortcuts if args.term.lower() in s.lower()]
+            index = _get_lowered_index(creator, mode)
+            matching = [name for name, lowered in index if term_lower in lowered]
             if matching:
-                found_shortcuts[mode] = matching
+                found_shortcuts[mode] = sorted(matching)
         
         if not found_shortcuts:
             print(f"No shortcuts found matching '{args.term}'")
@@ -339,21 +371,11 @@ def search_shortcuts(creator: DesktopFileCreator, args) -> int:
         print()
         
         for mode, shortcuts in found_shortcuts.items():
-            print(f"📁 {mode.upper()} mode ({len(shortcuts)} matches):")
-            
-            if args.verbose:
-                for shortcut in sorted(shortcuts):
-                    details = creator.get_shortcut_details(shortcut, mode)
-                    print(f"  • {shortcut}")
-                    if details:
-                        print(f"    Description: {details.get('description', 'N/A')}")
-                        print(f"    URL: {details.get('url', 'N/A')}")
-                        print(f"    Browser: {details.get('browser_command', 'xdg-open')}")
-                    print()
-            else:
-                for shortcut in sorted(shortcuts):
-                    print(f"  • {shortcut}")
-            print()
+            # Build each mode's block first and write it in one call
+            lines = [f"📁 {mode.upper()} mode ({len(shortcuts)} matches):"]
+            lines.extend(_format_shortcut_lines(creator, mode, shortcuts, args.verbose))
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         return 0
         
@@ -368,10 +390,10 @@ def show_shortcut(creator: DesktopFileCreator, args) -> int:
         modes_to_check = ["user", "system"] if args.mode == "all" else [args.mode]
         
         for mode in modes_to_check:
-            shortcuts = creator.list_shortcuts(mode)
-            if args.name in shortcuts:
-                details = creator.get_shortcut_details(args.name, mode)
-                
+            # Shortcuts made by LazyLauncher sit at their sanitized filename, so one
+            # stat usually answers; only fall back to scanning the directory if not
+            details = creator.get_shortcut_details(args.name, mode)
+            if details.get('name') == args.name or args.name in creator.list_shortcuts(mode):
                 print(f"📋 Shortcut Details: {args.name}")
                 print(f"{'='*50}")
                 print(f"Mode:        {mode}")
@@ -381,9 +403,7 @@ def show_shortcut(creator: DesktopFileCreator, args) -> int:
                 print(f"Browser:     {details.get('browser_command', 'xdg-open')}")
                 
                 # Show file location
-                from lazylauncher.utils import sanitize_filename
-                from lazylauncher.config import Config
-                config = Config()
+                config = Config.instance()
                 filename = sanitize_filename(args.name) + ".desktop"
                 file_path = config.get_applications_dir(mode) / filename
                 print(f"File:        {file_path}")
@@ -398,5 +418,16 @@ def show_shortcut(creator: DesktopFileCreator, args) -> int:
         return 1
 
 
+# Command name -> (help text, argument builder, handler)
+COMMANDS = {
+    "create": ("Create a new shortcut", _add_create_arguments, create_shortcut),
+    "update": ("Update an existing shortcut", _add_update_arguments, update_shortcut),
+    "remove": ("Remove a shortcut", _add_remove_arguments, remove_shortcut),
+    "list": ("List existing shortcuts", _add_list_arguments, list_shortcuts),
+    "search": ("Search shortcuts by name", _add_search_arguments, search_shortcuts),
+    "show": ("Show detailed information about a shortcut", _add_show_arguments, show_shortcut),
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())